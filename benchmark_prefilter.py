@@ -0,0 +1,109 @@
+import random
+import statistics
+import time
+from medical_codes import extract_all_codes
+from utils import filter_pages
+
+# Narrative text similar to the policy sections that never contain codes
+NARRATIVE_LINES = [
+    "This policy describes the criteria for coverage of the services listed below.",
+    "Members must meet all of the clinical requirements before authorization is granted.",
+    "Refer to the member's benefit plan document for exclusions and limitations.",
+    "The plan reserves the right to update this policy without prior notice.",
+    "References: American Medical Association guidelines, published clinical studies.",
+]
+
+def make_narrative_page(lines=40):
+    """Build a page of plain policy text"""
+    return "\n".join(random.choice(NARRATIVE_LINES) for _ in range(lines))
+
+def make_code_table_page(rows=40):
+    """Build a page laid out like a code table"""
+    header = "CPT/HCPCS Code Description"
+    rows_text = []
+    for _ in range(rows):
+        code = random.choice([
+            f"{random.randint(10000, 99999)}",
+            f"{random.choice('ABGJ')}{random.randint(0, 9999):04d}",
+            f"{random.randint(0, 999):04d}U",
+        ])
+        rows_text.append(f"{code} {random.choice(NARRATIVE_LINES)}")
+    return "\n".join([header] + rows_text)
+
+def make_inline_code_page(lines=40):
+    """Build a narrative page that mentions a code in the middle of a sentence"""
+    page = make_narrative_page(lines)
+    return page + f"\nThis policy also applies to {random.randint(10000, 99999)} when billed together."
+
+def make_edge_code_page(lines=40):
+    """Build a narrative page that ends on a code with no trailing text"""
+    return make_narrative_page(lines) + f"\nsee {random.choice('ABGJ')}{random.randint(0, 9999):04d}"
+
+def make_corpus(pages=500, table_ratio=0.2, inline_ratio=0.05, edge_ratio=0.05):
+    """Build a mixed corpus of narrative, code-table and boundary-case pages"""
+    corpus = []
+    for _ in range(pages):
+        roll = random.random()
+        if roll < table_ratio:
+            corpus.append(make_code_table_page())
+        elif roll < table_ratio + inline_ratio:
+            corpus.append(make_inline_code_page())
+        elif roll < table_ratio + inline_ratio + edge_ratio:
+            corpus.append(make_edge_code_page())
+        else:
+            corpus.append(make_narrative_page())
+    return corpus
+
+def time_extraction(pages):
+    """Time code extraction over the page text joined the way read_pdf joins it"""
+    start = time.perf_counter()
+    results = extract_all_codes("\n".join(pages))
+    return time.perf_counter() - start, results
+
+def time_filtered_extraction(pages):
+    """Time the pre-filter plus code extraction over the kept pages"""
+    start = time.perf_counter()
+    stats = {}
+    kept_pages = filter_pages(pages, stats)
+    results = extract_all_codes("\n".join(kept_pages))
+    return time.perf_counter() - start, results, stats
+
+def main(repeats=7):
+    random.seed(0)
+    pages = make_corpus()
+    
+    # Untimed warm-up so neither path pays the cold-start cost alone
+    extract_all_codes("\n".join(pages))
+    
+    # Alternate the order of the two paths on each repeat
+    baseline_times = []
+    filtered_times = []
+    filter_times = []
+    for i in range(repeats):
+        if i % 2 == 0:
+            baseline_seconds, baseline_results = time_extraction(pages)
+            filtered_seconds, filtered_results, stats = time_filtered_extraction(pages)
+        else:
+            filtered_seconds, filtered_results, stats = time_filtered_extraction(pages)
+            baseline_seconds, baseline_results = time_extraction(pages)
+        baseline_times.append(baseline_seconds)
+        filtered_times.append(filtered_seconds)
+        filter_times.append(stats["filter_seconds"])
+    
+    baseline_median = statistics.median(baseline_times)
+    filtered_median = statistics.median(filtered_times)
+    filter_median = statistics.median(filter_times)
+    
+    baseline_codes = {(r["code"], r["code_type"]) for r in baseline_results}
+    filtered_codes = {(r["code"], r["code_type"]) for r in filtered_results}
+    
+    print(f"Pages: {stats['pages_total']}, skipped: {stats['pages_skipped']}")
+    print(f"Median of {repeats} runs after warm-up")
+    print(f"Without pre-filter: {baseline_median * 1000:.1f} ms")
+    print(f"With pre-filter:    {filtered_median * 1000:.1f} ms "
+          f"(filter {filter_median * 1000:.1f} ms)")
+    print(f"Time saved:         {(baseline_median - filtered_median) * 1000:.1f} ms")
+    print(f"Same codes found:   {baseline_codes == filtered_codes}")
+
+if __name__ == "__main__":
+    main()
@@ -52,13 +52,22 @@ def upload_to_databricks(server=None, token=None, schema=None):
     except Exception as e:
         st.error(f"Error connecting to Databricks: {str(e)}")
 
+# Function to report what the page pre-filter skipped
+def show_prefilter_stats(page_stats):
+    if not page_stats:
+        return
+    st.caption(f"Pre-filter skipped {page_stats['pages_skipped']} of {page_stats['pages_total']} pages "
+               f"with no candidate codes in {page_stats['filter_seconds'] * 1000:.1f} ms")
+
 # Function to process individual file with metadata
-def process_pdf(file, metadata):
+def process_pdf(file, metadata, prefilter=True):
     try:
-        # Read the PDF content
-        pdf_content = read_pdf(file)
+        # Read the PDF content, optionally skipping pages without candidate codes
+        page_stats = {}
+        pdf_content = read_pdf(file, prefilter=prefilter, stats=page_stats)
         
-        if not pdf_content:
+        # An empty result is only expected when the pre-filter skipped every page
+        if pdf_content is None or (not pdf_content and not page_stats.get("pages_skipped")):
             st.error(f"Could not read content from {file.name}")
             return False
         
@@ -77,9 +86,11 @@ def process_pdf(file, metadata):
             # Add to session state
             st.session_state.extracted_codes.extend(extracted_data)
             st.success(f"Successfully processed {file.name} - Found {len(extracted_data)} codes")
+            show_prefilter_stats(page_stats)
             return True
         else:
             st.warning(f"No codes extracted from {file.name}")
+            show_prefilter_stats(page_stats)
             return False
     except Exception as e:
         st.error(f"Error processing {file.name}: {str(e)}")
@@ -102,6 +113,7 @@ if uploaded_files:
                                    value=datetime.now().year, key=f"year_{i}")
             lob = st.selectbox("Line of Business",
                                ["Medicare", "Medicaid", "Commercial", "Marketplace", "Other"], key=f"lob_{i}")
+            prefilter = st.checkbox("Skip pages without candidate codes", value=True, key=f"prefilter_{i}")
 
             if st.button(f"Process {file.name}", key=f"process_{i}"):
                 metadata = {
@@ -112,7 +124,7 @@ if uploaded_files:
                     "line_of_business": lob,
                     "processed_date": datetime.now().strftime("%Y-%m-%d")
                 }
-                process_pdf(file, metadata)
+                process_pdf(file, metadata, prefilter=prefilter)
 
 # Display and Export
 if st.session_state.extracted_codes:
@@ -7,6 +7,35 @@ CPT_PATTERN = r'\b\d{5}\b'  # Basic 5-digit CPT codes
 HCPCS_PATTERN = r'\b[A-Z]\d{4}\b'  # HCPCS codes (e.g., G0101)
 PLA_PATTERN = r'\b\d{4}[A-Z]\b'  # PLA codes (e.g., 0001U)
 
+# Single pass used to cheaply reject pages before running the full extraction
+CANDIDATE_PATTERN = re.compile(r'\b(?:\d{5}|[A-Z]\d{4}|\d{4}[A-Z])\b')
+
+# Whole words that usually appear on the code tables of a medical policy
+CODE_TABLE_KEYWORD_PATTERN = re.compile(r'\b(?:CPT|HCPCS|PLA|CODES?|DESCRIPTION)\b', re.IGNORECASE)
+
+def page_has_candidate_codes(text):
+    """Check whether a page contains at least one token that could be a code"""
+    if not text:
+        return False
+    
+    # Stops at the first match, so narrative pages cost a single scan
+    return CANDIDATE_PATTERN.search(text) is not None
+
+def is_code_table_page(text, min_codes=5):
+    """Guess whether a page is a code table from keyword and layout signals"""
+    if not text:
+        return False
+    
+    has_keyword = CODE_TABLE_KEYWORD_PATTERN.search(text) is not None
+    
+    # Code tables put one code at the start of each row
+    code_rows = sum(
+        1 for line in text.splitlines()
+        if CANDIDATE_PATTERN.match(line.strip())
+    )
+    
+    return has_keyword and code_rows >= min_codes
+
 def extract_cpt_codes(text):
     """Extract CPT codes from text"""
     if not text:
@@ -0,0 +1,89 @@
+import io
+import utils
+from medical_codes import extract_all_codes, page_has_candidate_codes, is_code_table_page
+from utils import filter_pages, read_pdf
+
+NARRATIVE_PAGE = "This policy describes the criteria for coverage.\nRefer to the member's benefit plan."
+TABLE_PAGE = "CPT Code Description\n" + "\n".join(f"9920{i} Office visit" for i in range(5)) + "\nsee 99213"
+INLINE_PAGE = "Procedure 0001U applies."
+EDGE_PAGE = "Covered when billed with G0101"
+
+def code_set(text):
+    return {(r["code"], r["code_type"]) for r in extract_all_codes(text)}
+
+class FakePage:
+    def __init__(self, text):
+        self.text = text
+
+    def extract_text(self):
+        return self.text
+
+class FakeReader:
+    def __init__(self, pages):
+        self.pages = [FakePage(text) for text in pages]
+
+def test_page_has_candidate_codes():
+    assert not page_has_candidate_codes("")
+    assert not page_has_candidate_codes(None)
+    assert not page_has_candidate_codes(NARRATIVE_PAGE)
+    assert not page_has_candidate_codes("Call 555-12345678 or see section 1234.")
+    assert page_has_candidate_codes("Bill 99213 once")
+    assert page_has_candidate_codes("Bill G0101 once")
+    assert page_has_candidate_codes("Bill 0001U once")
+
+def test_is_code_table_page():
+    assert is_code_table_page(TABLE_PAGE)
+    assert not is_code_table_page(INLINE_PAGE)
+    assert not is_code_table_page(NARRATIVE_PAGE)
+    # Enough code rows but no table keyword
+    assert not is_code_table_page("\n".join(f"9920{i} visit" for i in range(5)))
+    # "plan" must not count as the PLA keyword
+    assert not is_code_table_page("The plan covers:\n" + "\n".join(f"1000{i} Main Street" for i in range(5)))
+
+def test_filter_pages_keeps_order_and_reports_stats():
+    pages = [NARRATIVE_PAGE, INLINE_PAGE, NARRATIVE_PAGE, TABLE_PAGE, EDGE_PAGE]
+    stats = {}
+
+    kept = filter_pages(pages, stats)
+
+    assert kept == [INLINE_PAGE, TABLE_PAGE, EDGE_PAGE]
+    assert stats["pages_total"] == 5
+    assert stats["pages_skipped"] == 2
+    assert "code_table_pages" not in stats
+    assert stats["filter_seconds"] >= 0
+
+def test_filter_pages_detect_tables():
+    stats = {}
+
+    filter_pages([NARRATIVE_PAGE, INLINE_PAGE, TABLE_PAGE], stats, detect_tables=True)
+
+    assert stats["code_table_pages"] == 1
+
+def test_filter_does_not_change_extracted_codes():
+    corpus = [
+        [INLINE_PAGE, TABLE_PAGE],
+        [TABLE_PAGE, NARRATIVE_PAGE, INLINE_PAGE],
+        [EDGE_PAGE, NARRATIVE_PAGE, INLINE_PAGE, NARRATIVE_PAGE, TABLE_PAGE],
+        [NARRATIVE_PAGE, NARRATIVE_PAGE],
+    ]
+    for pages in corpus:
+        assert code_set("\n".join(filter_pages(pages))) == code_set("\n".join(pages))
+
+def test_read_pdf_keeps_boundary_codes(monkeypatch):
+    pages = [INLINE_PAGE, NARRATIVE_PAGE, TABLE_PAGE, EDGE_PAGE, NARRATIVE_PAGE]
+    monkeypatch.setattr(utils.PyPDF2, "PdfReader", lambda stream: FakeReader(pages))
+
+    stats = {}
+    filtered = read_pdf(io.BytesIO(b""), stats=stats)
+    unfiltered = read_pdf(io.BytesIO(b""), prefilter=False)
+
+    assert stats["pages_skipped"] == 2
+    assert code_set(filtered) == code_set(unfiltered)
+    assert {("99213", "CPT"), ("0001U", "PLA"), ("G0101", "HCPCS")} <= code_set(filtered)
+
+def test_read_pdf_all_pages_skipped(monkeypatch):
+    monkeypatch.setattr(utils.PyPDF2, "PdfReader", lambda stream: FakeReader([NARRATIVE_PAGE]))
+
+    stats = {}
+    assert read_pdf(io.BytesIO(b""), stats=stats) == ""
+    assert stats["pages_skipped"] == 1
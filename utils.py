@@ -1,21 +1,48 @@
 import io
+import time
 import PyPDF2
 import pandas as pd
 from datetime import datetime
+from medical_codes import page_has_candidate_codes, is_code_table_page
 
-def read_pdf(uploaded_file):
+def filter_pages(pages, stats=None, detect_tables=False):
+    """
+    Drop pages that contain no candidate codes
+
+    When detect_tables is enabled, kept pages that look like code tables are
+    counted in stats as well; this costs a second pass over the kept pages.
+    """
+    start = time.perf_counter()
+    
+    kept_pages = [page_text for page_text in pages if page_has_candidate_codes(page_text)]
+    
+    if stats is not None:
+        stats["pages_total"] = len(pages)
+        stats["pages_skipped"] = len(pages) - len(kept_pages)
+        if detect_tables:
+            stats["code_table_pages"] = sum(1 for page_text in kept_pages if is_code_table_page(page_text))
+        stats["filter_seconds"] = time.perf_counter() - start
+    
+    return kept_pages
+
+def read_pdf(uploaded_file, prefilter=True, stats=None):
     """
     Extract text content from an uploaded PDF file
+
+    When prefilter is enabled, pages without any candidate codes are skipped.
+    Pass a dict as stats to receive the page counts from the pre-filter.
     """
     try:
         pdf_reader = PyPDF2.PdfReader(io.BytesIO(uploaded_file.read()))
-        text = ""
-        for page_num in range(len(pdf_reader.pages)):
-            text += pdf_reader.pages[page_num].extract_text()
+        pages = [page.extract_text() or "" for page in pdf_reader.pages]
+        
+        if prefilter:
+            pages = filter_pages(pages, stats)
         
         # Reset file pointer for future reads
         uploaded_file.seek(0)
-        return text
+        # Separate pages so tokens are never merged across page boundaries
+        return "\n".join(pages)
     except Exception as e:
         print(f"Error reading PDF: {str(e)}")
         return None